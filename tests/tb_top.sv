@@ -0,0 +1,94 @@
+`timescale 1ns/1ps
+
+// tb_top.sv - HDL testbench wrapper for the CA coprocessor
+//
+// The clock and the latency-modelled memory used to live in Python
+// (cocotb Clock + a per-edge driver coroutine), which cost two VPI
+// round-trips per simulated cycle.  Both now run on the simulator side:
+// Python only touches the wrapper for test-level events (instruction
+// issue, ready wait, backdoor memory access).
+module tb_top;
+
+    parameter LATENCY = 10;        // simulated DRAM latency in cycles
+
+    // HDL-side clock: no VPI traffic per edge
+    reg clk = 1'b0;
+    always #5 clk = ~clk;
+
+    // CPU interface, driven from Python
+    reg         rst_n    = 1'b0;
+    reg         enable   = 1'b0;
+    reg  [2:0]  funct3   = 3'd0;
+    reg  [6:0]  funct7   = 7'd0;
+    reg  [31:0] rs1_data = 32'h0;
+    reg  [31:0] rs2_data = 32'h0;
+    reg  [11:0] imm      = 12'h0;
+    wire [31:0] rd_data;
+    wire        ready;
+
+    // Memory interface between DUT and the HDL memory model
+    wire [31:0] mem_addr;
+    wire [63:0] mem_wdata;
+    wire        mem_we;
+    wire        mem_re;
+    reg  [63:0] mem_rdata = 64'h0;
+    reg         mem_ready = 1'b0;
+
+    ca_coprocessor dut (
+        .clk       (clk),
+        .rst_n     (rst_n),
+        .enable    (enable),
+        .funct3    (funct3),
+        .funct7    (funct7),
+        .rs1_data  (rs1_data),
+        .rs2_data  (rs2_data),
+        .imm       (imm),
+        .rd_data   (rd_data),
+        .ready     (ready),
+        .mem_addr  (mem_addr),
+        .mem_wdata (mem_wdata),
+        .mem_rdata (mem_rdata),
+        .mem_we    (mem_we),
+        .mem_re    (mem_re),
+        .mem_ready (mem_ready)
+    );
+
+    // 8K x 64-bit memory, word-addressed by mem_addr[15:3].  Python
+    // reads/writes this array directly (backdoor) for test setup and
+    // verification; only DUT traffic goes through the handshake below.
+    reg [63:0] mem [0:8191];
+
+    integer init_i;
+    initial begin
+        for (init_i = 0; init_i < 8192; init_i = init_i + 1)
+            mem[init_i] = 64'h0;
+    end
+
+    // Latency-counter state machine: same protocol as the old Python
+    // driver (request sampled on posedge, LATENCY cycles of delay, then
+    // a single-cycle mem_ready pulse).
+    reg [3:0] lat_ctr = 4'd0;
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            lat_ctr   <= 4'd0;
+            mem_ready <= 1'b0;
+            mem_rdata <= 64'h0;
+        end else begin
+            if (mem_ready) begin
+                mem_ready <= 1'b0;
+            end else if (lat_ctr != 4'd0) begin
+                lat_ctr <= lat_ctr - 4'd1;
+                if (lat_ctr == 4'd1) begin
+                    if (mem_re)
+                        mem_rdata <= mem[mem_addr[15:3]];
+                    if (mem_we)
+                        mem[mem_addr[15:3]] <= mem_wdata;
+                    mem_ready <= 1'b1;
+                end
+            end else if (mem_we || mem_re) begin
+                lat_ctr <= LATENCY[3:0];
+            end
+        end
+    end
+
+endmodule